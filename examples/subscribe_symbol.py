@@ -1,7 +1,7 @@
 import asyncio
 from datetime import datetime
 
-from sodex_api import SodexWebSocketClient, DepthData, Orderbook, TradeData, SodexAPIError, Config
+from sodex_api import SodexWebSocketClient, DepthData, Orderbook, TradeData, SodexAPIError, Config, install_uvloop
 
 def handle_symbol_data(data):
     timestamp = datetime.now().strftime('%H:%M:%S')
@@ -54,4 +54,5 @@ async def main():
         print("Disconnected from WebSocket")
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
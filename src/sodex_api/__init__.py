@@ -6,7 +6,7 @@ A Python client library for interacting with the SoDEX API.
 __version__ = "1.0.0"
 
 from .client import SodexClient
-from .ws_client import SodexWebSocketClient
+from .ws_client import SodexWebSocketClient, install_uvloop
 from .exceptions import SodexAPIError
 from .models import *
 from .config import *
@@ -14,6 +14,7 @@ from .config import *
 __all__ = [
     "SodexClient",
     "SodexWebSocketClient",
+    "install_uvloop",
     "SodexAPIError",
     "__version__",
 ] 
\ No newline at end of file
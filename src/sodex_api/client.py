@@ -4,17 +4,21 @@ import hashlib
 import hmac
 import uuid
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from loguru import logger
 
 from .config import Config
 from .models import Balance, Orderbook, OBItem, Order, KlineData, TickerData, TradeData, OrderFill, SymbolInfo, OrderSide
 from .exceptions import SodexAPIError
+from ._compat import json_loads
 
 # Constants
 DEFAULT_ORDERBOOK_LIMIT = 100
 REQUEST_TIMEOUT = 10.0
 MAX_PAGE_SIZE = 100
+MAX_PAGE_FETCH_WORKERS = 4
+SUPPORTED_HTTP_METHODS = frozenset({'GET', 'POST', 'DELETE'})
 
 # Symbol mappings for Sodex API
 SYMBOL_MAPPING = {
@@ -25,6 +29,45 @@ SYMBOL_MAPPING = {
 
 REVERSE_SYMBOL_MAPPING = {v: k for k, v in SYMBOL_MAPPING.items()}
 
+
+def _to_standard_symbol(sodex_symbol: str) -> str:
+    """Convert a Sodex-format symbol to standard format (used on parse paths)."""
+    return REVERSE_SYMBOL_MAPPING.get(sodex_symbol, sodex_symbol)
+
+
+def _level_price(raw_price: Any) -> float:
+    """Convert a raw level price, rejecting non-positive values like OBItem does."""
+    price = float(raw_price)
+    if price <= 0:
+        raise ValueError("Price must be positive")
+    return price
+
+
+def _format_levels(raw_levels: List[List[Any]]) -> List[OBItem]:
+    """
+    Format raw [price, quantity] levels into OBItem objects.
+    
+    Each value is converted once. Levels with no quantity are dropped and a
+    non-positive price raises ValueError, which covers what OBItem validates,
+    so the items are built without re-running that validation.
+    
+    Args:
+        raw_levels: Raw price levels from API
+        
+    Returns:
+        List of OBItem objects
+        
+    Raises:
+        ValueError: If a level has a non-positive price
+    """
+    new_item = OBItem._unchecked
+    return [
+        new_item(_level_price(level[0]), quantity)
+        for level in raw_levels
+        if len(level) >= 2 and (quantity := float(level[1])) > 0
+    ]
+
+
 class SodexClient:
     """Client for interacting with Sodex Exchange API."""
     
@@ -44,7 +87,8 @@ class SodexClient:
         })
         return session
 
-    def _convert_symbol(self, symbol: str, reverse: bool = False) -> str:
+    @staticmethod
+    def _convert_symbol(symbol: str, reverse: bool = False) -> str:
         """
         Convert symbol between standard format and Sodex format.
         
@@ -75,15 +119,17 @@ class SodexClient:
             SodexAPIError: If signature generation fails
         """
         try:
-            # Build raw string from parameters
-            raw_string = "&".join([f"{key}={value}" for key, value in sorted_params.items()])
-            # Add timestamp parameter
-            raw_string += f"&timestamp={timestamp}"
-            
+            # Build the message as bytes with a single join; batch payloads
+            # (ordersJsonStr) can be tens of KB, so avoid copying them again.
+            # With no params the message still starts with '&timestamp='.
+            parts = [f"{key}={value}".encode('utf-8') for key, value in sorted_params.items()] or [b""]
+            parts.append(f"timestamp={timestamp}".encode('utf-8'))
+            raw_bytes = b"&".join(parts)
+
             # Generate HMAC-SHA256 signature
             signature = hmac.new(
                 self.secret_key.encode('utf-8'),
-                raw_string.encode('utf-8'),
+                raw_bytes,
                 hashlib.sha256
             ).hexdigest()
             return signature
@@ -103,9 +149,10 @@ class SodexClient:
         Raises:
             SodexAPIError: If response indicates error
         """
-        if response_data.get('code') != 0:
+        code = response_data.get('code')
+        if code != 0:
             error_msg = response_data.get('msg', 'Unknown error')
-            raise SodexAPIError(f"API Error: {error_msg}")
+            raise SodexAPIError(f"API Error [{code}]: {error_msg}")
         return response_data.get('data')
     
     def _make_request(self, 
@@ -131,29 +178,31 @@ class SodexClient:
         if params is None:
             params = {}
         
-        timestamp = str(int(time.time() * 1000))
-        headers = self.session.headers.copy()
+        method = method.upper()
+        if method not in SUPPORTED_HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
+        # Session default headers are merged in by requests; only signed
+        # requests need per-call headers (and a timestamp)
+        headers = None
         if signed:
-            # Add authentication headers
-            headers['X-Request-Timestamp'] = timestamp
-            headers['X-Request-Nonce'] = str(uuid.uuid4())
-            headers['X-Signature'] = self._generate_signature(params, timestamp)
+            timestamp = str(int(time.time() * 1000))
+            headers = {
+                'X-Request-Timestamp': timestamp,
+                'X-Request-Nonce': str(uuid.uuid4()),
+                'X-Signature': self._generate_signature(params, timestamp)
+            }
         
         url = f"{self.base_url}{endpoint}"
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
-            elif method.upper() == 'POST':
-                response = requests.post(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
+            response = self.session.request(method, url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return self._handle_response(response.json())
+            try:
+                response_data = json_loads(response.content)
+            except ValueError as e:
+                raise SodexAPIError(f"Invalid JSON response for {endpoint}: {str(e)}")
+            return self._handle_response(response_data)
         
         except requests.exceptions.Timeout:
             raise SodexAPIError(f"Request timeout for {endpoint}")
@@ -354,16 +403,20 @@ class SodexClient:
         """
         Batch place orders.
         """
-        orders_json = []
-        for order in orders:
-            sodex_symbol = self._convert_symbol(order.symbol)
-            orders_json.append({
+        # Hoist per-order formatters out of the loop for large batches
+        format_price = "{:.2f}".format
+        format_quantity = "{:.4f}".format
+        convert_symbol = self._convert_symbol
+        orders_json = [
+            {
                 'direction': order.side.upper(),
-                'price': f"{order.price:.2f}",
-                'symbol': sodex_symbol,
-                'totalAmount': f"{order.quantity:.4f}",
+                'price': format_price(order.price),
+                'symbol': convert_symbol(order.symbol),
+                'totalAmount': format_quantity(order.quantity),
                 'tradeType': order.type.upper(),
-            })
+            }
+            for order in orders
+        ]
         params = {'ordersJsonStr': json.dumps(orders_json)}
         resp = self._make_request('POST', '/spot/v1/u/trade/order/batch/create', params=params, signed=True)
         order_ids = [data["data"] for data in resp]
@@ -387,7 +440,7 @@ class SodexClient:
             return []
         
         # Filter out empty IDs
-        valid_order_ids = [oid.strip() for oid in order_ids if oid and oid.strip()]
+        valid_order_ids = [stripped for oid in order_ids if oid and (stripped := oid.strip())]
         
         if not valid_order_ids:
             logger.info('No valid order IDs to cancel')
@@ -545,7 +598,7 @@ class SodexClient:
                     fill = OrderFill(
                         order_id=str(fill_data.get('orderId', '')),
                         exec_id=str(fill_data.get('execId', '')),
-                        symbol=self._convert_symbol(fill_data.get('symbol', ''), reverse=True),
+                        symbol=_to_standard_symbol(fill_data.get('symbol', '')),
                         quantity=float(fill_data.get('quantity', 0)),
                         price=float(fill_data.get('price', 0)),
                         fee=float(fill_data.get('fee', 0)),
@@ -632,16 +685,17 @@ class SodexClient:
             
             klines = []
             for kline_data in response_data:
+                get = kline_data.get
                 try:
                     kline = KlineData(
-                        symbol=self._convert_symbol(kline_data.get('s', ''), reverse=True),
-                        timestamp=int(kline_data.get('t', 0)),
-                        open_price=float(kline_data.get('o', 0)),
-                        high_price=float(kline_data.get('h', 0)),
-                        low_price=float(kline_data.get('l', 0)),
-                        close_price=float(kline_data.get('c', 0)),
-                        volume=float(kline_data.get('a', 0)),
-                        quote_volume=float(kline_data.get('v', 0))
+                        symbol=_to_standard_symbol(get('s', '')),
+                        timestamp=int(get('t', 0)),
+                        open_price=float(get('o', 0)),
+                        high_price=float(get('h', 0)),
+                        low_price=float(get('l', 0)),
+                        close_price=float(get('c', 0)),
+                        volume=float(get('a', 0)),
+                        quote_volume=float(get('v', 0))
                     )
                     klines.append(kline)
                 except (ValueError, TypeError) as e:
@@ -678,7 +732,7 @@ class SodexClient:
                 return None
             
             return TickerData(
-                symbol=self._convert_symbol(response_data.get('s', ''), reverse=True),
+                symbol=_to_standard_symbol(response_data.get('s', '')),
                 timestamp=int(response_data.get('t', 0)),
                 open_price=float(response_data.get('o', 0)),
                 high_price=float(response_data.get('h', 0)),
@@ -710,17 +764,18 @@ class SodexClient:
             
             tickers = []
             for ticker_data in response_data:
+                get = ticker_data.get
                 try:
                     ticker = TickerData(
-                        symbol=self._convert_symbol(ticker_data.get('s', ''), reverse=True),
-                        timestamp=int(ticker_data.get('t', 0)),
-                        open_price=float(ticker_data.get('o', 0)),
-                        high_price=float(ticker_data.get('h', 0)),
-                        low_price=float(ticker_data.get('l', 0)),
-                        close_price=float(ticker_data.get('c', 0)),
-                        volume=float(ticker_data.get('a', 0)),
-                        quote_volume=float(ticker_data.get('v', 0)),
-                        price_change_percent=float(ticker_data.get('r', 0))
+                        symbol=_to_standard_symbol(get('s', '')),
+                        timestamp=int(get('t', 0)),
+                        open_price=float(get('o', 0)),
+                        high_price=float(get('h', 0)),
+                        low_price=float(get('l', 0)),
+                        close_price=float(get('c', 0)),
+                        volume=float(get('a', 0)),
+                        quote_volume=float(get('v', 0)),
+                        price_change_percent=float(get('r', 0))
                     )
                     tickers.append(ticker)
                 except (ValueError, TypeError) as e:
@@ -767,7 +822,7 @@ class SodexClient:
             for trade_data in response_data:
                 try:
                     trade = TradeData(
-                        symbol=self._convert_symbol(trade_data.get('s', ''), reverse=True),
+                        symbol=_to_standard_symbol(trade_data.get('s', '')),
                         timestamp=int(trade_data.get('t', 0)),
                         price=float(trade_data.get('p', 0)),
                         quantity=float(trade_data.get('a', 0)),
@@ -812,9 +867,13 @@ class SodexClient:
         try:
             # Use the specific URL for symbol list endpoint
             url = f"{Config.SODEX_BASE_URL_EXT}/pro/p/symbol/list"
-            response = requests.get(url, timeout=REQUEST_TIMEOUT)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            response_data = self._handle_response(response.json())
+            try:
+                payload = json_loads(response.content)
+            except ValueError as e:
+                raise SodexAPIError(f"Invalid JSON response for symbol list: {str(e)}")
+            response_data = self._handle_response(payload)
             
             if not isinstance(response_data, list):
                 logger.error("Invalid symbol list response format")
@@ -822,38 +881,44 @@ class SodexClient:
             
             symbols = []
             for symbol_data in response_data:
+                get = symbol_data.get
                 try:
+                    # Optional numeric fields: look each key up once
+                    lever = get('lever')
+                    risk_rate = get('riskRate')
+                    min_price = get('minPrice')
+                    min_notional = get('minNotional')
                     symbol_info = SymbolInfo(
-                        id=int(symbol_data.get('id', 0)),
-                        symbol=symbol_data.get('symbol', ''),
-                        name=symbol_data.get('name'),
-                        lever=float(symbol_data['lever']) if symbol_data.get('lever') is not None else None,
-                        risk_rate=float(symbol_data['riskRate']) if symbol_data.get('riskRate') is not None else None,
-                        trade_switch=bool(symbol_data.get('tradeSwitch', False)),
-                        buy_coin=symbol_data.get('buyCoin', ''),
-                        sell_coin=symbol_data.get('sellCoin', ''),
-                        buy_coin_precision=int(symbol_data.get('buyCoinPrecision', 0)),
-                        buy_coin_display_precision=int(symbol_data.get('buyCoinDisplayPrecision', 0)),
-                        sell_coin_precision=int(symbol_data.get('sellCoinPrecision', 0)),
-                        sell_coin_display_precision=int(symbol_data.get('sellCoinDisplayPrecision', 0)),
-                        quantity_precision=int(symbol_data.get('quantityPrecision', 0)),
-                        price_precision=int(symbol_data.get('pricePrecision', 0)),
-                        support_order_type=symbol_data.get('supportOrderType', ''),
-                        support_time_in_force=symbol_data.get('supportTimeInForce', ''),
-                        min_price=float(symbol_data['minPrice']) if symbol_data.get('minPrice') is not None else None,
-                        min_qty=symbol_data.get('minQty', '0'),
-                        min_notional=float(symbol_data['minNotional']) if symbol_data.get('minNotional') is not None else None,
-                        multiplier_down=symbol_data.get('multiplierDown', '0'),
-                        multiplier_up=symbol_data.get('multiplierUp', '0'),
-                        maker_fee=symbol_data.get('makerFee', '0'),
-                        taker_fee=symbol_data.get('takerFee', '0'),
-                        market_take_bound=symbol_data.get('marketTakeBound', '0'),
-                        depth_precision_merge=int(symbol_data.get('depthPrecisionMerge', 0)),
-                        onboard_date=int(symbol_data.get('onboardDate', 0)),
-                        sequence=int(symbol_data.get('sequence', 0)),
-                        set_type=int(symbol_data.get('setType', 0)),
-                        uids=symbol_data.get('uids'),
-                        hot=bool(symbol_data.get('hot', False))
+                        id=int(get('id', 0)),
+                        symbol=get('symbol', ''),
+                        name=get('name'),
+                        lever=float(lever) if lever is not None else None,
+                        risk_rate=float(risk_rate) if risk_rate is not None else None,
+                        trade_switch=bool(get('tradeSwitch', False)),
+                        buy_coin=get('buyCoin', ''),
+                        sell_coin=get('sellCoin', ''),
+                        buy_coin_precision=int(get('buyCoinPrecision', 0)),
+                        buy_coin_display_precision=int(get('buyCoinDisplayPrecision', 0)),
+                        sell_coin_precision=int(get('sellCoinPrecision', 0)),
+                        sell_coin_display_precision=int(get('sellCoinDisplayPrecision', 0)),
+                        quantity_precision=int(get('quantityPrecision', 0)),
+                        price_precision=int(get('pricePrecision', 0)),
+                        support_order_type=get('supportOrderType', ''),
+                        support_time_in_force=get('supportTimeInForce', ''),
+                        min_price=float(min_price) if min_price is not None else None,
+                        min_qty=get('minQty', '0'),
+                        min_notional=float(min_notional) if min_notional is not None else None,
+                        multiplier_down=get('multiplierDown', '0'),
+                        multiplier_up=get('multiplierUp', '0'),
+                        maker_fee=get('makerFee', '0'),
+                        taker_fee=get('takerFee', '0'),
+                        market_take_bound=get('marketTakeBound', '0'),
+                        depth_precision_merge=int(get('depthPrecisionMerge', 0)),
+                        onboard_date=int(get('onboardDate', 0)),
+                        sequence=int(get('sequence', 0)),
+                        set_type=int(get('setType', 0)),
+                        uids=get('uids'),
+                        hot=bool(get('hot', False))
                     )
                     symbols.append(symbol_info)
                 except (ValueError, TypeError) as e:
@@ -874,34 +939,36 @@ class SodexClient:
         Returns:
             List of order data dictionaries
         """
-        orders = []
-        page = 1
-        
-        while True:
+        def fetch_page(page: int) -> Any:
             params = {
                 'page': page,
                 'size': MAX_PAGE_SIZE,
                 'state': state,
                 'symbol': sodex_symbol
             }
-            
-            response_data = self._make_request('GET', '/spot/v1/u/trade/order/list', params=params, signed=True)
-            
-            if not isinstance(response_data, dict):
-                break
-            
-            items = response_data.get('items', [])
-            orders.extend(items)
-            
-            # Check if we have more pages
-            current_page = response_data.get('page', 0)
-            page_size = response_data.get('ps', 0)
-            total = response_data.get('total', 0)
-            
-            if current_page * page_size >= total:
-                break
-            
-            page += 1
+            return self._make_request('GET', '/spot/v1/u/trade/order/list', params=params, signed=True)
+        
+        response_data = fetch_page(1)
+        if not isinstance(response_data, dict):
+            return []
+        
+        orders = list(response_data.get('items', []))
+        
+        # The first page tells us how many pages remain; fetch them concurrently
+        current_page = response_data.get('page', 1)
+        page_size = response_data.get('ps', 0)
+        total = response_data.get('total', 0)
+        
+        if page_size <= 0 or current_page * page_size >= total:
+            return orders
+        
+        last_page = -(-total // page_size)
+        remaining_pages = range(current_page + 1, last_page + 1)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_FETCH_WORKERS, len(remaining_pages))) as executor:
+            for page_data in executor.map(fetch_page, remaining_pages):
+                if isinstance(page_data, dict):
+                    orders.extend(page_data.get('items', []))
         
         return orders
     
@@ -949,7 +1016,7 @@ class SodexClient:
             return Order(
                 order_id=str(raw_order.get('orderId', '')),
                 client_order_id=raw_order.get('clientOrderId'),
-                symbol=self._convert_symbol(raw_order.get('symbol', ''), reverse=True),
+                symbol=_to_standard_symbol(raw_order.get('symbol', '')),
                 side=raw_order.get('orderSide', '').upper(),
                 quantity=float(raw_order.get('origQty', 0)),
                 price=float(raw_order.get('price', 0)),
@@ -973,20 +1040,17 @@ class SodexClient:
         Raises:
             SodexAPIError: If orderbook data is invalid
         """
+        # Only read the clock when the snapshot carries no timestamp
+        timestamp = raw_orderbook.get("t")
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        
         try:
             return Orderbook( 
-                symbol=self._convert_symbol(raw_orderbook.get('s', ''), reverse=True),
-                timestamp=raw_orderbook.get("t", int(time.time() * 1000)),
-                bids=[
-                    OBItem(price=float(bid[0]), quantity=float(bid[1])) 
-                    for bid in raw_orderbook.get('b', [])
-                    if len(bid) >= 2 and float(bid[1]) > 0
-                ],
-                asks=[
-                    OBItem(price=float(ask[0]), quantity=float(ask[1])) 
-                    for ask in raw_orderbook.get('a', [])
-                    if len(ask) >= 2 and float(ask[1]) > 0
-                ]
+                symbol=_to_standard_symbol(raw_orderbook.get('s', '')),
+                timestamp=timestamp,
+                bids=_format_levels(raw_orderbook.get('b', [])),
+                asks=_format_levels(raw_orderbook.get('a', []))
             )
         except (KeyError, ValueError, TypeError) as e:
             raise SodexAPIError(f"Invalid orderbook data format: {e}")
@@ -1,12 +1,25 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal
+from functools import cached_property
+from operator import attrgetter
+from typing import List, Optional, Literal, Tuple, Union
 import time
 
 OrderSide = Literal["BUY", "SELL"]
 
+_price_key = attrgetter("price")
+_quantity_key = attrgetter("quantity")
+_notional_key = attrgetter("notional_value")
+
+# String statuses plus the API's integer state codes (1=pending, 2=partially filled)
+_ACTIVE_STATUSES = frozenset({"NEW", "PARTIALLY_FILLED", "PENDING", 1, 2})
+_BUY_SIDES = frozenset({"BUY", "BID"})
+_SELL_SIDES = frozenset({"SELL", "ASK"})
+
 @dataclass
 class OBItem:
     """Represents a single orderbook item (bid or ask)."""
+    __slots__ = ("price", "quantity")
+
     price: float
     quantity: float
 
@@ -17,6 +30,17 @@ class OBItem:
         if self.quantity <= 0:
             raise ValueError("Quantity must be positive")
 
+    @classmethod
+    def _unchecked(cls, price: float, quantity: float) -> "OBItem":
+        """Create an item without running validation.
+
+        Only for callers that have already checked price > 0 and quantity > 0.
+        """
+        item = object.__new__(cls)
+        item.price = price
+        item.quantity = quantity
+        return item
+
     @property
     def notional_value(self) -> float:
         """Calculate the notional value (price * quantity)."""
@@ -25,7 +49,13 @@ class OBItem:
 
 @dataclass
 class Orderbook:
-    """Represents an orderbook snapshot from an exchange."""
+    """
+    Represents an orderbook snapshot from an exchange.
+
+    Bids are sorted by descending price and asks by ascending price on
+    construction, so the best levels are always at index 0. Code that updates
+    bids or asks afterwards (e.g. applying DepthData) must keep them sorted.
+    """
     symbol: str
     timestamp: int
     bids: List[OBItem] = field(default_factory=list)
@@ -37,39 +67,84 @@ class Orderbook:
             raise ValueError("Symbol cannot be empty")
         if self.timestamp <= 0:
             raise ValueError("Timestamp must be positive")
+        # Sort copies so the caller's lists are left untouched; exchange data
+        # arrives already ordered, which makes these linear passes
+        self.bids = sorted(self.bids, key=_price_key, reverse=True)
+        self.asks = sorted(self.asks, key=_price_key)
 
     @property
     def best_bid(self) -> Optional[OBItem]:
         """Get the best bid (highest price)."""
-        return max(self.bids, key=lambda x: x.price) if self.bids else None
+        return self.bids[0] if self.bids else None
 
     @property
     def best_ask(self) -> Optional[OBItem]:
         """Get the best ask (lowest price)."""
-        return min(self.asks, key=lambda x: x.price) if self.asks else None
+        return self.asks[0] if self.asks else None
+
+    def _best_pair(self) -> Optional[Tuple[float, float]]:
+        """Get the (best bid price, best ask price) pair, or None if a side is empty."""
+        if self.bids and self.asks:
+            return self.bids[0].price, self.asks[0].price
+        return None
 
     @property
     def mid_price(self) -> Optional[float]:
         """Calculate the mid price between best bid and ask."""
-        best_bid = self.best_bid
-        best_ask = self.best_ask
-        if best_bid and best_ask:
-            return (best_bid.price + best_ask.price) / 2
+        best_pair = self._best_pair()
+        if best_pair:
+            return (best_pair[0] + best_pair[1]) / 2
         return None
 
     @property
     def spread_percentage(self) -> Optional[float]:
         """Calculate the spread as a percentage."""
-        best_bid = self.best_bid
-        best_ask = self.best_ask
-        if best_bid and best_ask and self.mid_price:
-            return (best_ask.price - best_bid.price) / self.mid_price
+        best_pair = self._best_pair()
+        if best_pair:
+            bid_price, ask_price = best_pair
+            mid_price = (bid_price + ask_price) / 2
+            if mid_price:
+                return (ask_price - bid_price) / mid_price
         return None
 
     @property
     def is_valid(self) -> bool:
         """Check if the orderbook has valid structure."""
-        return bool(self.bids and self.asks and self.best_bid and self.best_ask)
+        return bool(self.bids) and bool(self.asks)
+
+    @staticmethod
+    def _top(items: List[OBItem], levels: Optional[int]) -> List[OBItem]:
+        """Get the best N levels of one side (all levels if N is None)."""
+        if levels is None:
+            return items
+        if levels < 0:
+            raise ValueError("Levels cannot be negative")
+        return items[:levels]
+
+    def bid_volume(self, levels: Optional[int] = None) -> float:
+        """Get total bid quantity over the best N levels (all levels if N is None)."""
+        return sum(map(_quantity_key, self._top(self.bids, levels)))
+
+    def ask_volume(self, levels: Optional[int] = None) -> float:
+        """Get total ask quantity over the best N levels (all levels if N is None)."""
+        return sum(map(_quantity_key, self._top(self.asks, levels)))
+
+    def bid_notional(self, levels: Optional[int] = None) -> float:
+        """Get total bid notional (price * quantity) over the best N levels."""
+        return sum(map(_notional_key, self._top(self.bids, levels)))
+
+    def ask_notional(self, levels: Optional[int] = None) -> float:
+        """Get total ask notional (price * quantity) over the best N levels."""
+        return sum(map(_notional_key, self._top(self.asks, levels)))
+
+    def imbalance(self, levels: Optional[int] = None) -> Optional[float]:
+        """Calculate (bid volume - ask volume) / total volume over the best N levels."""
+        bid_volume = self.bid_volume(levels)
+        ask_volume = self.ask_volume(levels)
+        total = bid_volume + ask_volume
+        if total:
+            return (bid_volume - ask_volume) / total
+        return None
 
 
 @dataclass
@@ -107,7 +182,7 @@ class Order:
     quantity: float
     price: float
     type: str
-    status: str
+    status: Union[str, int]
     timestamp: int
     client_order_id: Optional[str] = None
 
@@ -122,6 +197,9 @@ class Order:
         if self.price <= 0:
             raise ValueError("Price must be positive")
         self.side = self.side.upper()
+        # The API reports state codes as ints; only normalize string statuses
+        if isinstance(self.status, str):
+            self.status = self.status.upper()
 
     @property
     def notional_value(self) -> float:
@@ -141,14 +219,20 @@ class Order:
     @property
     def is_active(self) -> bool:
         """Check if the order is in an active state."""
-        active_statuses = {'NEW', 'PARTIALLY_FILLED', 'PENDING'}
-        return self.status.upper() in active_statuses
+        return self.status in _ACTIVE_STATUSES
 
     @property
     def age_seconds(self) -> float:
         """Calculate the age of the order in seconds."""
         return time.time() - (self.timestamp / 1000.0)  # Assuming timestamp is in milliseconds
 
+    @staticmethod
+    def ages_seconds(orders: List["Order"], now: Optional[float] = None) -> List[float]:
+        """Calculate the ages of many orders in seconds against a single clock reading."""
+        if now is None:
+            now = time.time()
+        return [now - order.timestamp / 1000.0 for order in orders]
+
 
 @dataclass
 class KlineData:
@@ -243,6 +327,8 @@ class TickerData:
 @dataclass
 class TradeData:
     """Represents a recent trade."""
+    __slots__ = ("symbol", "timestamp", "price", "quantity", "side")
+
     symbol: str
     timestamp: int
     price: float
@@ -261,6 +347,8 @@ class TradeData:
             raise ValueError("Quantity must be positive")
         if not self.side:
             raise ValueError("Side cannot be empty")
+        if isinstance(self.side, str):
+            self.side = self.side.upper()
 
     @property
     def notional_value(self) -> float:
@@ -270,12 +358,12 @@ class TradeData:
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy trade."""
-        return self.side.upper() in ('BUY', 'BID')
+        return self.side in _BUY_SIDES
 
     @property
     def is_sell(self) -> bool:
         """Check if this is a sell trade."""
-        return self.side.upper() in ('SELL', 'ASK')
+        return self.side in _SELL_SIDES
 
 
 @dataclass
@@ -311,6 +399,7 @@ class OrderFill:
             raise ValueError("Side must be 'BUY' or 'SELL'")
         if self.timestamp <= 0:
             raise ValueError("Timestamp must be positive")
+        self.side = self.side.upper()
 
     @property
     def notional_value(self) -> float:
@@ -320,12 +409,12 @@ class OrderFill:
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy fill."""
-        return self.side.upper() == 'BUY'
+        return self.side == 'BUY'
 
     @property
     def is_sell(self) -> bool:
         """Check if this is a sell fill."""
-        return self.side.upper() == 'SELL'
+        return self.side == 'SELL'
 
 
 @dataclass
@@ -384,17 +473,17 @@ class SymbolInfo:
         """Check if trading is enabled for this symbol."""
         return self.trade_switch
 
-    @property
+    @cached_property
     def supported_order_types(self) -> List[str]:
         """Get list of supported order types."""
-        return [ot.strip() for ot in self.support_order_type.split(',') if ot.strip()]
+        return [stripped for ot in self.support_order_type.split(',') if (stripped := ot.strip())]
 
-    @property
+    @cached_property
     def supported_time_in_force(self) -> List[str]:
         """Get list of supported time in force options."""
-        return [tif.strip() for tif in self.support_time_in_force.split(',') if tif.strip()]
+        return [stripped for tif in self.support_time_in_force.split(',') if (stripped := tif.strip())]
 
-    @property
+    @cached_property
     def min_quantity(self) -> float:
         """Get minimum quantity as float."""
         try:
@@ -402,7 +491,7 @@ class SymbolInfo:
         except (ValueError, TypeError):
             return 0.0
 
-    @property
+    @cached_property
     def maker_fee_rate(self) -> float:
         """Get maker fee rate as float."""
         try:
@@ -410,7 +499,7 @@ class SymbolInfo:
         except (ValueError, TypeError):
             return 0.0
 
-    @property
+    @cached_property
     def taker_fee_rate(self) -> float:
         """Get taker fee rate as float."""
         try:
@@ -421,6 +510,8 @@ class SymbolInfo:
 @dataclass
 class DepthData:
     """Represents depth/orderbook update data."""
+    __slots__ = ("id", "symbol", "side", "price", "quantity", "timestamp")
+
     id: str
     symbol: str
     side: Literal["ASK", "BID"]
@@ -432,6 +523,11 @@ class DepthData:
 @dataclass
 class KlineStreamData:
     """Represents kline stream data."""
+    __slots__ = (
+        "symbol", "open_price", "close_price", "high_price", "low_price",
+        "volume", "quote_volume", "interval", "timestamp",
+    )
+
     symbol: str
     open_price: float
     close_price: float
@@ -445,6 +541,12 @@ class KlineStreamData:
 @dataclass
 class UserBalanceData:
     """Represents user balance update data."""
+    __slots__ = (
+        "coin", "balance_type", "balance", "freeze", "available_balance",
+        "estimated_total_amount", "estimated_cny_amount",
+        "estimated_available_amount", "estimated_coin_type",
+    )
+
     coin: str
     balance_type: int
     balance: float
@@ -459,6 +561,11 @@ class UserBalanceData:
 @dataclass
 class UserOrderData:
     """Represents user order update data."""
+    __slots__ = (
+        "order_id", "balance_type", "order_type", "symbol", "price", "direction",
+        "orig_qty", "avg_price", "executed_qty", "state", "create_time",
+    )
+
     order_id: str
     balance_type: int
     order_type: OrderSide
@@ -475,6 +582,8 @@ class UserOrderData:
 @dataclass
 class UserTradeData:
     """Represents user trade execution data."""
+    __slots__ = ("order_id", "price", "quantity", "margin_unfrozen", "timestamp")
+
     order_id: str
     price: float
     quantity: float
@@ -485,6 +594,11 @@ class UserTradeData:
 @dataclass
 class SystemMessage:
     """Represents system notification message."""
+    __slots__ = (
+        "id", "title", "content", "agg_type", "detail_type", "created_time",
+        "all_scope", "user_id", "read",
+    )
+
     id: int
     title: str
     content: str
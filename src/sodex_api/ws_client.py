@@ -1,13 +1,15 @@
 import asyncio
-import json
+import time
 import websockets
-from typing import Dict, Optional, Callable, Any, Union
+from websockets.asyncio.client import connect as ws_connect
+from typing import Dict, Optional, Callable, Any, Tuple, Union
 from dataclasses import dataclass
 from loguru import logger
 from enum import Enum
 
-from .client import SodexClient, SodexAPIError
-from .models import Orderbook, OBItem, TradeData, TickerData, UserBalanceData, UserOrderData, UserTradeData, SystemMessage, KlineStreamData, DepthData
+from ._compat import json_dumps, json_loads
+from .client import SodexClient, SodexAPIError, _format_levels, _to_standard_symbol
+from .models import Orderbook, TradeData, TickerData, UserBalanceData, UserOrderData, UserTradeData, SystemMessage, KlineStreamData, DepthData
 
 class SubscriptionType(Enum):
     """WebSocket subscription types."""
@@ -24,10 +26,39 @@ class WebSocketConfig:
     ping_timeout: int = 10
     reconnect_interval: int = 5
     max_reconnect_attempts: int = 10
+    # When > 0, each subscription callback runs in its own task fed by a queue
+    # of this size (oldest events are dropped when full); 0 calls callbacks
+    # directly from the listen loop
+    callback_queue_size: int = 0
 
 
 SOCKET_URL_PATH = "/spot/v1/ws/socket"
 
+# Side codes as sent by the server (int, or numeric string); anything else is the other side
+_SIDE_MAP = {1: "BUY", "1": "BUY"}
+_DEPTH_SIDE_MAP = {1: "BID", "1": "BID"}
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop implementation if it is available.
+    
+    Must be called before the event loop is created (i.e. before asyncio.run()).
+    Falls back to the default loop when uvloop is not installed or on Windows.
+    
+    Returns:
+        bool: True if uvloop was installed, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 class SodexWebSocketClient:
     """WebSocket client for Sodex Exchange real-time data."""
     
@@ -40,10 +71,31 @@ class SodexWebSocketClient:
         self.is_authenticated = False
         self.auth_token = None
         self.subscriptions = set()
+        # Serialized market data subscription messages, replayed on reconnect
+        self._subscription_payloads: Dict[str, str] = {}
         self.callbacks = {}
+        # Market data callbacks keyed by the raw Sodex symbol (and interval)
+        # so handlers can look them up without building a key per frame
+        self._symbol_callbacks: Dict[str, Callable] = {}
+        self._kline_callbacks: Dict[Tuple[str, str], Callable] = {}
         self.reconnect_count = 0
         self._ping_task = None
         self._listen_task = None
+        self._callback_tasks: Dict[str, asyncio.Task] = {}
+        # Raw callbacks behind queued subscriptions, so their consumers can be
+        # restarted on connect(): key -> (callback dict, callback dict key, callback)
+        self._queued_callbacks: Dict[str, Tuple[Dict[Any, Callable], Any, Callable]] = {}
+        self._message_handlers = {
+            "qDepth": self._handle_depth_data,
+            "qAllDepth": self._handle_all_depth_data,
+            "qDeal": self._handle_deal_data,
+            "qKLine": self._handle_kline_data,
+            "qStats": self._handle_stats_data,
+            "uBalance": self._handle_user_balance_data,
+            "uOrder": self._handle_user_order_data,
+            "uTrade": self._handle_user_trade_data,
+            "znxMessage": self._handle_system_message,
+        }
         
     async def connect(self) -> bool:
         """
@@ -54,15 +106,20 @@ class SodexWebSocketClient:
         """
         try:
             logger.info(f"Connecting to WebSocket: {self.url}")
-            self.websocket = await websockets.connect(
+            # Protocol-level keepalive detects dead connections; the text "ping"
+            # sent by _ping_loop is still needed by the Sodex server itself
+            self.websocket = await ws_connect(
                 self.url,
-                ping_interval=None,  # We handle ping manually
+                ping_interval=self.config.ping_interval,
                 ping_timeout=self.config.ping_timeout
             )
             self.is_connected = True
             self.reconnect_count = 0
             logger.info("WebSocket connected successfully")
             
+            # Restart callback consumers stopped by a previous disconnect()
+            self._restart_callback_queues()
+            
             # Start ping task
             self._ping_task = asyncio.create_task(self._ping_loop())
             
@@ -83,6 +140,7 @@ class SodexWebSocketClient:
             self._ping_task.cancel()
         if self._listen_task:
             self._listen_task.cancel()
+        self._stop_callback_queues()
         
         # Close connection
         if self.websocket:
@@ -100,7 +158,9 @@ class SodexWebSocketClient:
         """
         try:
             logger.info("Getting WebSocket authentication token")
-            self.auth_token = self.sodex_client.get_websocket_token()
+            # The token is fetched over blocking HTTP; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            self.auth_token = await loop.run_in_executor(None, self.sodex_client.get_websocket_token)
             self.is_authenticated = True
             logger.info("WebSocket authentication successful")
             return True
@@ -127,11 +187,9 @@ class SodexWebSocketClient:
             "symbol": sodex_symbol
         }
         
-        await self._send_message(subscription)
+        await self._send_subscription(f"symbol_{sodex_symbol}", subscription)
         
-        callback_key = f"symbol_{sodex_symbol}"
-        self.callbacks[callback_key] = callback
-        self.subscriptions.add(callback_key)
+        self._set_callback(self._symbol_callbacks, sodex_symbol, f"symbol_{sodex_symbol}", callback)
         
         logger.info(f"Subscribed to symbol data: {symbol}")
     
@@ -156,12 +214,12 @@ class SodexWebSocketClient:
             "type": interval
         }
         
-        await self._send_message(subscription)
+        await self._send_subscription(f"kline_{sodex_symbol}_{interval}", subscription)
         
         # Store callback
-        callback_key = f"kline_{sodex_symbol}_{interval}"
-        self.callbacks[callback_key] = callback
-        self.subscriptions.add(callback_key)
+        self._set_callback(
+            self._kline_callbacks, (sodex_symbol, interval), f"kline_{sodex_symbol}_{interval}", callback
+        )
         
         logger.info(f"Subscribed to kline data: {symbol} {interval}")
     
@@ -179,12 +237,10 @@ class SodexWebSocketClient:
             "sub": SubscriptionType.STATS.value
         }
         
-        await self._send_message(subscription)
+        await self._send_subscription("stats", subscription)
         
         # Store callback
-        callback_key = "stats"
-        self.callbacks[callback_key] = callback
-        self.subscriptions.add(callback_key)
+        self._set_callback(self.callbacks, "stats", "stats", callback)
         
         logger.info("Subscribed to statistics data")
     
@@ -216,16 +272,97 @@ class SodexWebSocketClient:
         
         # Store callbacks
         if balance_callback:
-            self.callbacks["user_balance"] = balance_callback
+            self._set_callback(self.callbacks, "user_balance", "user_balance", balance_callback)
         if order_callback:
-            self.callbacks["user_order"] = order_callback
+            self._set_callback(self.callbacks, "user_order", "user_order", order_callback)
         if trade_callback:
-            self.callbacks["user_trade"] = trade_callback
+            self._set_callback(self.callbacks, "user_trade", "user_trade", trade_callback)
         
         self.subscriptions.add("user_data")
         
         logger.info("Subscribed to user data")
     
+    def _set_callback(self, callbacks: Dict[Any, Callable], callback_key: Any, key: str,
+                      callback: Callable[[Any], None]):
+        """
+        Register a subscription callback, behind a queue if configured.
+        
+        Args:
+            callbacks: Callback dict the handlers read from
+            callback_key: Key of the callback in that dict
+            key: Subscription key the callback belongs to
+            callback: User callback
+        """
+        if self.config.callback_queue_size > 0:
+            self._queued_callbacks[key] = (callbacks, callback_key, callback)
+            callback = self._wrap_callback(key, callback)
+        callbacks[callback_key] = callback
+    
+    def _wrap_callback(self, key: str, callback: Callable[[Any], None]) -> Callable[[Any], None]:
+        """
+        Decouple a subscription callback from the listen loop.
+        
+        Events are put on a bounded queue (callback_queue_size) consumed by
+        a dedicated task that runs the callback in the default executor, so a slow
+        callback cannot stall message parsing. When the queue is full the oldest
+        event is dropped; drops are logged once when a burst starts and summarized
+        once the consumer has caught up.
+        
+        Args:
+            key: Subscription key the callback belongs to
+            callback: User callback
+            
+        Returns:
+            Callable to invoke from the message handlers
+        """
+        maxsize = self.config.callback_queue_size
+        previous = self._callback_tasks.pop(key, None)
+        if previous:
+            previous.cancel()
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        dropped = 0
+        
+        def enqueue(event: Any):
+            nonlocal dropped
+            if queue.full():
+                queue.get_nowait()
+                if not dropped:
+                    logger.warning(f"Callback queue full for {key}, dropping oldest events")
+                dropped += 1
+            queue.put_nowait(event)
+        
+        async def consume():
+            nonlocal dropped
+            loop = asyncio.get_running_loop()
+            while True:
+                event = await queue.get()
+                try:
+                    await loop.run_in_executor(None, callback, event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in {key} callback: {e}")
+                
+                if dropped and queue.empty():
+                    logger.warning(f"Dropped {dropped} events for {key} callback")
+                    dropped = 0
+        
+        self._callback_tasks[key] = asyncio.create_task(consume())
+        return enqueue
+    
+    def _stop_callback_queues(self):
+        """Cancel callback consumer tasks; the callbacks stay registered."""
+        for task in self._callback_tasks.values():
+            task.cancel()
+        self._callback_tasks.clear()
+    
+    def _restart_callback_queues(self):
+        """Re-wrap queued callbacks whose consumer task was stopped by disconnect()."""
+        for key, (callbacks, callback_key, callback) in self._queued_callbacks.items():
+            if key not in self._callback_tasks:
+                callbacks[callback_key] = self._wrap_callback(key, callback)
+    
     async def start_listening(self):
         """Start listening for WebSocket messages."""
         if not self.is_connected:
@@ -242,13 +379,23 @@ class SodexWebSocketClient:
     
     async def _send_message(self, message: Dict[str, Any]):
         """Send message to WebSocket server."""
+        await self._send_raw(json_dumps(message))
+    
+    async def _send_raw(self, message_str: str):
+        """Send an already serialized message to WebSocket server."""
         if not self.websocket:
             raise SodexAPIError("WebSocket not connected")
         
-        message_str = json.dumps(message)
         await self.websocket.send(message_str)
         logger.debug(f"Sent WebSocket message: {message_str}")
     
+    async def _send_subscription(self, key: str, subscription: Dict[str, Any]):
+        """Send a subscription message and remember it for resubscription."""
+        payload = json_dumps(subscription)
+        await self._send_raw(payload)
+        self._subscription_payloads[key] = payload
+        self.subscriptions.add(key)
+    
     async def _ping_loop(self):
         """Send periodic ping messages to keep connection alive."""
         while self.is_connected:
@@ -265,27 +412,34 @@ class SodexWebSocketClient:
     
     async def _listen_loop(self):
         """Listen for WebSocket messages."""
+        if not self.websocket:
+            return
+        
+        # Bind hot-path lookups once; each listen task serves a single connection
+        # (reconnects start a fresh task), so these stay valid for its lifetime
+        recv = self.websocket.recv
+        loads = json_loads
+        handle = self._handle_message
+        
         while self.is_connected:
             try:
-                if not self.websocket:
-                    break
-                
-                message = await self.websocket.recv()
+                # Receive raw bytes and let the JSON parser do the decoding
+                message = await recv(decode=False)
                 
                 # Handle pong response
-                if message == "pong":
+                if message == b"pong":
                     logger.debug("Received pong message")
                     continue
 
-                if message == "succeed":
+                if message == b"succeed":
                     continue
                 
                 # Parse JSON message
                 try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse WebSocket message: {message}, error: {e}")
+                    data = loads(message)
+                    handle(data)
+                except ValueError as e:
+                    logger.warning(f"Failed to parse WebSocket message: {message!r}, error: {e}")
                 
             except asyncio.CancelledError:
                 break
@@ -298,265 +452,247 @@ class SodexWebSocketClient:
                 logger.error(f"Error in listen loop: {e}")
                 await asyncio.sleep(1)
     
-    async def _handle_message(self, data: Dict[str, Any]):
+    def _handle_message(self, data: Dict[str, Any]):
         """Handle incoming WebSocket message."""
+        handler = None
         try:
             res_type = data.get("resType")
-            message_data = data.get("data", {})
+            handler = self._message_handlers.get(res_type)
             
-            if res_type == "qDepth":
-                await self._handle_depth_data(message_data)
-            elif res_type == "qAllDepth":
-                await self._handle_all_depth_data(message_data)
-            elif res_type == "qDeal":
-                await self._handle_deal_data(message_data)
-            elif res_type == "qKLine":
-                await self._handle_kline_data(message_data)
-            elif res_type == "qStats":
-                await self._handle_stats_data(message_data)
-            elif res_type == "uBalance":
-                await self._handle_user_balance_data(message_data)
-            elif res_type == "uOrder":
-                await self._handle_user_order_data(message_data)
-            elif res_type == "uTrade":
-                await self._handle_user_trade_data(message_data)
-            elif res_type == "znxMessage":
-                await self._handle_system_message(message_data)
-            else:
+            if handler is None:
                 logger.debug(f"Unhandled message type: {res_type}")
+                return
+            
+            handler(data.get("data", {}))
                 
         except Exception as e:
-            logger.error(f"Error handling WebSocket message: {e}")
+            handler_name = handler.__name__ if handler else "_handle_message"
+            logger.error(f"Error handling WebSocket message in {handler_name}: {e}, message: {data!r}")
     
-    async def _handle_depth_data(self, data: Dict[str, Any]):
+    def _handle_depth_data(self, data: Dict[str, Any]):
         """Handle depth update data."""
-        try:
-            depth = DepthData(
-                id=data.get("id", ""),
-                symbol=self.sodex_client._convert_symbol(data.get("s", ""), reverse=True),
-                side="BID" if int(data.get("m", 1)) == 1 else "ASK",
-                price=float(data.get("p", 0)),
-                quantity=float(data.get("q", 0)),
-                timestamp=int(data.get("t", 0))
-            )
-            
-            callback_key = f"symbol_{data.get('s', '')}"
-            if callback_key in self.callbacks:
-                self.callbacks[callback_key](depth)
-                
-        except Exception as e:
-            logger.error(f"Error handling depth data: {e}")
+        s = data.get("s", "")
+        callback = self._symbol_callbacks.get(s)
+        if callback is None:
+            return
+        
+        depth = DepthData(
+            id=data.get("id", ""),
+            symbol=_to_standard_symbol(s),
+            side=_DEPTH_SIDE_MAP.get(data.get("m", 1), "ASK"),
+            price=float(data.get("p", 0)),
+            quantity=float(data.get("q", 0)),
+            timestamp=int(data.get("t", 0))
+        )
+        
+        callback(depth)
     
-    async def _handle_all_depth_data(self, data: Dict[str, Any]):
+    def _handle_all_depth_data(self, data: Dict[str, Any]):
         """Handle full depth data."""
-        try:
-            # Convert raw asks and bids data to OBItem objects
-            asks = []
-            for ask_data in data.get("a", []):
-                if len(ask_data) >= 2:
-                    asks.append(OBItem(price=float(ask_data[0]), quantity=float(ask_data[1])))
-            
-            bids = []
-            for bid_data in data.get("b", []):
-                if len(bid_data) >= 2:
-                    bids.append(OBItem(price=float(bid_data[0]), quantity=float(bid_data[1])))
-            
-            # Create Orderbook instance
-            orderbook = Orderbook(
-                symbol=self.sodex_client._convert_symbol(data.get("s", ""), reverse=True),
-                timestamp=int(data.get("t", 0)) if data.get("t") else int(asyncio.get_event_loop().time() * 1000),
-                asks=asks,
-                bids=bids
-            )
-            
-            callback_key = f"symbol_{data.get('s', '')}"
-            if callback_key in self.callbacks:
-                self.callbacks[callback_key](orderbook)
-                
-        except Exception as e:
-            logger.error(f"Error handling all depth data: {e}")
+        s = data.get("s", "")
+        callback = self._symbol_callbacks.get(s)
+        if callback is None:
+            return
+        
+        t = data.get("t")
+        
+        # Convert raw asks and bids data to OBItem objects, dropping empty levels
+        asks = _format_levels(data.get("a", ()))
+        bids = _format_levels(data.get("b", ()))
+        
+        # Create Orderbook instance
+        orderbook = Orderbook(
+            symbol=_to_standard_symbol(s),
+            timestamp=int(t) if t else time.time_ns() // 1_000_000,
+            asks=asks,
+            bids=bids
+        )
+        
+        callback(orderbook)
     
-    async def _handle_deal_data(self, data: Dict[str, Any]):
+    def _handle_deal_data(self, data: Dict[str, Any]):
         """Handle trade/deal data."""
-        try:
-            # Convert side integer to string format expected by TradeData
-            side_int = int(data.get("m", 0))
-            side_str = "BUY" if side_int == 1 else "SELL"
-            
-            trade = TradeData(
-                symbol=self.sodex_client._convert_symbol(data.get("s", ""), reverse=True),
-                timestamp=int(data.get("t", 0)),
-                price=float(data.get("p", 0)),
-                quantity=float(data.get("a", 0)),
-                side=side_str
-            )
-            
-            callback_key = f"symbol_{data.get('s', '')}"
-            if callback_key in self.callbacks:
-                self.callbacks[callback_key](trade)
-                
-        except Exception as e:
-            logger.error(f"Error handling deal data: {e}")
+        s = data.get("s", "")
+        callback = self._symbol_callbacks.get(s)
+        if callback is None:
+            return
+        
+        trade = TradeData(
+            symbol=_to_standard_symbol(s),
+            timestamp=int(data.get("t", 0)),
+            price=float(data.get("p", 0)),
+            quantity=float(data.get("a", 0)),
+            side=_SIDE_MAP.get(data.get("m", 0), "SELL")
+        )
+        
+        callback(trade)
     
-    async def _handle_kline_data(self, data: Dict[str, Any]):
+    def _handle_kline_data(self, data: Dict[str, Any]):
         """Handle kline data."""
-        try:
-            kline = KlineStreamData(
-                symbol=self.sodex_client._convert_symbol(data.get("s", ""), reverse=True),
-                open_price=float(data.get("o", 0)),
-                close_price=float(data.get("c", 0)),
-                high_price=float(data.get("h", 0)),
-                low_price=float(data.get("l", 0)),
-                volume=float(data.get("a", 0)),
-                quote_volume=float(data.get("v", 0)),
-                interval=data.get("i", ""),
-                timestamp=int(data.get("t", 0))
-            )
-            
-            callback_key = f"kline_{data.get('s', '')}_{data.get('i', '')}"
-            if callback_key in self.callbacks:
-                self.callbacks[callback_key](kline)
-                
-        except Exception as e:
-            logger.error(f"Error handling kline data: {e}")
+        s = data.get("s", "")
+        interval = data.get("i", "")
+        callback = self._kline_callbacks.get((s, interval))
+        if callback is None:
+            return
+        
+        kline = KlineStreamData(
+            symbol=_to_standard_symbol(s),
+            open_price=float(data.get("o", 0)),
+            close_price=float(data.get("c", 0)),
+            high_price=float(data.get("h", 0)),
+            low_price=float(data.get("l", 0)),
+            volume=float(data.get("a", 0)),
+            quote_volume=float(data.get("v", 0)),
+            interval=interval,
+            timestamp=int(data.get("t", 0))
+        )
+        
+        callback(kline)
     
-    async def _handle_stats_data(self, data: Dict[str, Any]):
+    def _handle_stats_data(self, data: Dict[str, Any]):
         """Handle statistics data."""
-        try:
-            stats = TickerData(
-                symbol=self.sodex_client._convert_symbol(data.get("s", ""), reverse=True),
-                timestamp=int(data.get("t", 0)) if data.get("t") else int(asyncio.get_event_loop().time() * 1000),
-                open_price=float(data.get("o", 0)),
-                close_price=float(data.get("c", 0)),
-                high_price=float(data.get("h", 0)),
-                low_price=float(data.get("l", 0)),
-                volume=float(data.get("a", 0)),
-                quote_volume=float(data.get("v", 0)),
-                price_change_percent=float(data.get("r", 0))
-            )
-            
-            if "stats" in self.callbacks:
-                self.callbacks["stats"](stats)
-                
-        except Exception as e:
-            logger.error(f"Error handling stats data: {e}")
+        callback = self.callbacks.get("stats")
+        if callback is None:
+            return
+        
+        t = data.get("t")
+        stats = TickerData(
+            symbol=_to_standard_symbol(data.get("s", "")),
+            timestamp=int(t) if t else time.time_ns() // 1_000_000,
+            open_price=float(data.get("o", 0)),
+            close_price=float(data.get("c", 0)),
+            high_price=float(data.get("h", 0)),
+            low_price=float(data.get("l", 0)),
+            volume=float(data.get("a", 0)),
+            quote_volume=float(data.get("v", 0)),
+            price_change_percent=float(data.get("r", 0))
+        )
+        
+        callback(stats)
     
-    async def _handle_user_balance_data(self, data: Dict[str, Any]):
+    def _handle_user_balance_data(self, data: Dict[str, Any]):
         """Handle user balance data."""
-        try:
-            balance = UserBalanceData(
-                coin=data.get("coin", ""),
-                balance_type=int(data.get("balanceType", 0)),
-                balance=float(data.get("balance", 0)),
-                freeze=float(data.get("freeze", 0)),
-                available_balance=float(data.get("availableBalance", 0)),
-                estimated_total_amount=float(data.get("estimatedTotalAmount", 0)),
-                estimated_cny_amount=float(data.get("estimatedCynAmount", 0)),
-                estimated_available_amount=float(data.get("estimatedAvailableAmount", 0)),
-                estimated_coin_type=data.get("estimatedCoinType", "")
-            )
-            
-            if "user_balance" in self.callbacks:
-                self.callbacks["user_balance"](balance)
-                
-        except Exception as e:
-            logger.error(f"Error handling user balance data: {e}")
+        callback = self.callbacks.get("user_balance")
+        if callback is None:
+            return
+        
+        balance = UserBalanceData(
+            coin=data.get("coin", ""),
+            balance_type=int(data.get("balanceType", 0)),
+            balance=float(data.get("balance", 0)),
+            freeze=float(data.get("freeze", 0)),
+            available_balance=float(data.get("availableBalance", 0)),
+            estimated_total_amount=float(data.get("estimatedTotalAmount", 0)),
+            estimated_cny_amount=float(data.get("estimatedCynAmount", 0)),
+            estimated_available_amount=float(data.get("estimatedAvailableAmount", 0)),
+            estimated_coin_type=data.get("estimatedCoinType", "")
+        )
+        
+        callback(balance)
     
-    async def _handle_user_order_data(self, data: Dict[str, Any]):
+    def _handle_user_order_data(self, data: Dict[str, Any]):
         """Handle user order data."""
-        try:
-            order = UserOrderData(
-                order_id=str(data.get("orderId", "")),
-                balance_type=int(data.get("balanceType", 0)),
-                order_type="BUY" if int(data.get("orderType", 1)) == 1 else "SELL",
-                symbol=self.sodex_client._convert_symbol(data.get("symbol", ""), reverse=True),
-                price=float(data.get("price", 0)),
-                direction="BUY" if int(data.get("direction", 1)) == 1 else "SELL",
-                orig_qty=float(data.get("origQty", 0)),
-                avg_price=float(data.get("avgPrice", 0)),
-                executed_qty=float(data.get("dealQty", 0)),
-                state=int(data.get("state", 0)),
-                create_time=int(data.get("createTime", 0))
-            )
-            
-            if "user_order" in self.callbacks:
-                self.callbacks["user_order"](order)
-                
-        except Exception as e:
-            logger.error(f"Error handling user order data: {e}")
+        callback = self.callbacks.get("user_order")
+        if callback is None:
+            return
+        
+        order = UserOrderData(
+            order_id=str(data.get("orderId", "")),
+            balance_type=int(data.get("balanceType", 0)),
+            order_type=_SIDE_MAP.get(data.get("orderType", 1), "SELL"),
+            symbol=_to_standard_symbol(data.get("symbol", "")),
+            price=float(data.get("price", 0)),
+            direction=_SIDE_MAP.get(data.get("direction", 1), "SELL"),
+            orig_qty=float(data.get("origQty", 0)),
+            avg_price=float(data.get("avgPrice", 0)),
+            executed_qty=float(data.get("dealQty", 0)),
+            state=int(data.get("state", 0)),
+            create_time=int(data.get("createTime", 0))
+        )
+        
+        callback(order)
     
-    async def _handle_user_trade_data(self, data: Dict[str, Any]):
+    def _handle_user_trade_data(self, data: Dict[str, Any]):
         """Handle user trade data."""
-        try:
-            trade = UserTradeData(
-                order_id=str(data.get("orderId", "")),
-                price=float(data.get("price", 0)),
-                quantity=float(data.get("quantity", 0)),
-                margin_unfrozen=float(data.get("marginUnfrozen", 0)),
-                timestamp=int(data.get("timestamp", 0))
-            )
-            
-            if "user_trade" in self.callbacks:
-                self.callbacks["user_trade"](trade)
-                
-        except Exception as e:
-            logger.error(f"Error handling user trade data: {e}")
+        callback = self.callbacks.get("user_trade")
+        if callback is None:
+            return
+        
+        trade = UserTradeData(
+            order_id=str(data.get("orderId", "")),
+            price=float(data.get("price", 0)),
+            quantity=float(data.get("quantity", 0)),
+            margin_unfrozen=float(data.get("marginUnfrozen", 0)),
+            timestamp=int(data.get("timestamp", 0))
+        )
+        
+        callback(trade)
     
-    async def _handle_system_message(self, data: Dict[str, Any]):
+    def _handle_system_message(self, data: Dict[str, Any]):
         """Handle system notification message."""
-        try:
-            message = SystemMessage(
-                id=int(data.get("id", 0)),
-                title=data.get("title", ""),
-                content=data.get("content", ""),
-                agg_type=data.get("aggType", ""),
-                detail_type=data.get("detailType", ""),
-                created_time=int(data.get("createdTime", 0)),
-                all_scope=bool(data.get("allScope", False)),
-                user_id=int(data.get("userId", 0)),
-                read=bool(data.get("read", False))
-            )
-            
-            logger.info(f"System message: {message.title} - {message.content}")
-            
-        except Exception as e:
-            logger.error(f"Error handling system message: {e}")
+        message = SystemMessage(
+            id=int(data.get("id", 0)),
+            title=data.get("title", ""),
+            content=data.get("content", ""),
+            agg_type=data.get("aggType", ""),
+            detail_type=data.get("detailType", ""),
+            created_time=int(data.get("createdTime", 0)),
+            all_scope=bool(data.get("allScope", False)),
+            user_id=int(data.get("userId", 0)),
+            read=bool(data.get("read", False))
+        )
+        
+        logger.info(f"System message: {message.title} - {message.content}")
     
     async def _handle_reconnect(self):
         """Handle WebSocket reconnection."""
-        if self.reconnect_count >= self.config.max_reconnect_attempts:
-            logger.error("Max reconnection attempts reached, giving up")
-            return
-        
-        self.reconnect_count += 1
-        logger.info(f"Attempting to reconnect ({self.reconnect_count}/{self.config.max_reconnect_attempts})")
-        
-        await asyncio.sleep(self.config.reconnect_interval)
-        
-        if await self.connect():
-            # Re-authenticate if needed
-            if self.auth_token:
-                await self.authenticate()
+        # connect() resets reconnect_count on success, so count attempts locally
+        # to keep the loop bounded when a new connection fails after connecting
+        max_attempts = self.config.max_reconnect_attempts
+        attempt = 0
+        while attempt < max_attempts:
+            attempt += 1
+            self.reconnect_count = attempt
+            logger.info(f"Attempting to reconnect ({attempt}/{max_attempts})")
+            
+            await asyncio.sleep(self.config.reconnect_interval)
             
-            # Resubscribe to all previous subscriptions
-            await self._resubscribe()
+            if not await self.connect():
+                continue
             
-            # Restart listening
-            await self.start_listening()
-        else:
-            await self._handle_reconnect()
+            try:
+                # Re-authenticate if needed
+                if self.auth_token:
+                    await self.authenticate()
+                
+                # Resubscribe to all previous subscriptions
+                await self._resubscribe()
+                
+                # Restart listening
+                await self.start_listening()
+                return
+            except (websockets.exceptions.ConnectionClosed, SodexAPIError) as e:
+                logger.warning(f"Connection lost while restoring subscriptions: {e}")
+                self.is_connected = False
+                if self._ping_task:
+                    self._ping_task.cancel()
+        
+        logger.error("Max reconnection attempts reached, giving up")
     
     async def _resubscribe(self):
         """Resubscribe to all previous subscriptions after reconnection."""
         logger.info("Resubscribing to previous subscriptions")
         
-        # This is a simplified resubscription - in a production system,
-        # you would want to store subscription details and recreate them
-        for subscription in self.subscriptions:
-            logger.debug(f"Would resubscribe to: {subscription}")
+        for payload in self._subscription_payloads.values():
+            await self._send_raw(payload)
         
-        # Note: Actual resubscription would require storing subscription parameters
-        # and recreating the subscription messages
+        # User data subscriptions carry the auth token, so they are rebuilt
+        # with the token refreshed by the reconnect
+        if "user_data" in self.subscriptions and self.auth_token:
+            await self._send_message({
+                "sub": SubscriptionType.USER.value,
+                "token": self.auth_token
+            })
     
     def get_connection_status(self) -> Dict[str, Any]:
         """